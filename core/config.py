@@ -1,17 +1,29 @@
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 from .utils import read_text
 
 
+# path -> ((st_mtime_ns, st_size), parsed key/value pairs)
+_KV_CACHE: Dict[Path, Tuple[Tuple[int, int], Dict[str, str]]] = {}
+
+
 def load_kv_file(path: Path) -> Dict[str, str]:
     data: Dict[str, str] = {}
-    if not path.exists():
+    try:
+        stat = path.stat()
+    except OSError:
         return data
 
+    stat_key = (stat.st_mtime_ns, stat.st_size)
+    cached = _KV_CACHE.get(path)
+    if cached and cached[0] == stat_key:
+        return dict(cached[1])
+
     for raw_line in read_text(path).splitlines():
         line = raw_line.strip()
         if not line or line.startswith("#") or line.startswith(";"):
@@ -20,6 +32,8 @@ def load_kv_file(path: Path) -> Dict[str, str]:
             continue
         key, value = line.split("=", 1)
         data[key.strip()] = value.strip()
+
+    _KV_CACHE[path] = (stat_key, dict(data))
     return data
 
 
@@ -42,10 +56,12 @@ def _as_float(value: Optional[str], default: float) -> float:
 
 
 def _resolve_path(value: str, base_dir: Path) -> Path:
+    # os.path.normpath is pure string work; Path.resolve() would hit the
+    # filesystem to chase symlinks, which no consumer of these paths needs.
     path = Path(value)
     if path.is_absolute():
         return path
-    return (base_dir / path).resolve()
+    return Path(os.path.normpath(os.path.join(str(base_dir), value)))
 
 
 def _optional_path(value: Optional[str], base_dir: Path) -> Optional[Path]:
@@ -75,6 +91,7 @@ class MonitorConfig:
     rcon_timeout_sec: float
     steam_api_timeout_sec: int
     steamcmd_timeout_sec: int
+    steamcmd_ttl_sec: int
     steamcmd_dump_path: Optional[Path]
     msg_restart_5min: str
     msg_restart_1min: str
@@ -85,6 +102,20 @@ class MonitorConfig:
     log_path: Optional[Path]
 
 
+# (config_path, rcon_path) -> (stat keys of both files, built config)
+_CONFIG_CACHE: Dict[Tuple[Path, Optional[Path]], Tuple[Tuple, MonitorConfig]] = {}
+
+
+def _stat_key(path: Optional[Path]) -> Optional[Tuple[int, int]]:
+    if path is None:
+        return None
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
 def load_config(
     config_path: Path,
     rcon_path: Optional[Path],
@@ -93,6 +124,13 @@ def load_config(
     config_path = config_path.resolve()
     base_dir = config_path.parent
 
+    cache_key = (config_path, rcon_path)
+    stat_keys = (_stat_key(config_path), _stat_key(rcon_path))
+    if overrides is None:
+        cached = _CONFIG_CACHE.get(cache_key)
+        if cached and cached[0] == stat_keys:
+            return cached[1]
+
     data: Dict[str, str] = {}
     if rcon_path:
         data.update(load_kv_file(rcon_path))
@@ -119,7 +157,7 @@ def load_config(
         base_dir,
     )
 
-    return MonitorConfig(
+    cfg = MonitorConfig(
         ini_path=ini_path,
         steamapps_dir=steamapps_dir,
         steamcmd_path=steamcmd_path,
@@ -134,6 +172,7 @@ def load_config(
         rcon_timeout_sec=_as_float(data.get("RCONTimeoutSec"), 5.0),
         steam_api_timeout_sec=_as_int(data.get("SteamApiTimeoutSec"), 25),
         steamcmd_timeout_sec=_as_int(data.get("SteamcmdTimeoutSec"), 180),
+        steamcmd_ttl_sec=_as_int(data.get("SteamcmdTTLSec"), 3600),
         steamcmd_dump_path=steamcmd_dump_path,
         msg_restart_5min=data.get(
             "MsgRestart5Min", "Server will restart in 5 minutes."
@@ -149,3 +188,6 @@ def load_config(
         players_command=data.get("PlayersCommand", "players"),
         log_path=log_path,
     )
+    if overrides is None:
+        _CONFIG_CACHE[cache_key] = (stat_keys, cfg)
+    return cfg
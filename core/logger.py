@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import atexit
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 from .utils import now_str
 
@@ -9,13 +10,32 @@ from .utils import now_str
 class Logger:
     def __init__(self, log_path: Optional[Path]) -> None:
         self._log_path = log_path
+        self._fh = None
         if self._log_path:
             self._log_path.parent.mkdir(parents=True, exist_ok=True)
+            # Open once for the lifetime of the monitor; line buffering keeps
+            # the file current without an open/close pair per line.
+            self._fh = self._log_path.open("a", encoding="utf-8", buffering=1)
+            atexit.register(self.close)
+
+    def close(self) -> None:
+        if self._fh is not None:
+            try:
+                self._fh.close()
+            finally:
+                self._fh = None
 
     def log(self, message: str) -> None:
         line = f"[{now_str()}] {message}"
         print(line)
-        if not self._log_path:
+        if self._fh is not None:
+            self._fh.write(line + "\n")
+
+    def log_many(self, messages: List[str]) -> None:
+        if not messages:
             return
-        with self._log_path.open("a", encoding="utf-8") as f:
-            f.write(line + "\n")
+        stamp = now_str()
+        block = "\n".join(f"[{stamp}] {message}" for message in messages)
+        print(block)
+        if self._fh is not None:
+            self._fh.write(block + "\n")
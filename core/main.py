@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import argparse
-import time
+import signal
+import threading
 from pathlib import Path
 from typing import Tuple
 
@@ -14,6 +15,13 @@ from .updates import check_updates
 from .utils import format_ts
 
 
+_shutdown = threading.Event()
+
+
+def _request_shutdown(signum, frame) -> None:
+    _shutdown.set()
+
+
 def _default_paths() -> Tuple[Path, Path]:
     base_dir = Path(__file__).resolve().parent.parent
     config_path = base_dir / "monitor.conf"
@@ -30,14 +38,16 @@ def _log_update_result(cfg, result, logger: Logger) -> None:
     else:
         logger.log(f"Workshop mods: total={total_mods} outdated={len(outdated_mods)}")
 
-    for status in outdated_mods:
-        logger.log(
+    logger.log_many(
+        [
             "Mod outdated "
             f"id={status.workshop_id} "
             f"local={format_ts(status.local_mtime)} "
             f"remote={format_ts(status.remote_time_updated)} "
             f"title={status.remote_title or 'n/a'}"
-        )
+            for status in outdated_mods
+        ]
+    )
 
     logger.log(
         "Server buildid "
@@ -60,6 +70,7 @@ def run_once(cfg, logger: Logger) -> None:
             steam_api_timeout_sec=cfg.steam_api_timeout_sec,
             steamcmd_timeout_sec=cfg.steamcmd_timeout_sec,
             steamcmd_dump_path=cfg.steamcmd_dump_path,
+            steamcmd_ttl_sec=cfg.steamcmd_ttl_sec,
         )
     except Exception as exc:
         logger.log(f"Update check failed: {exc}")
@@ -96,7 +107,7 @@ def run_once(cfg, logger: Logger) -> None:
     immediate = player_count == 0
 
     try:
-        run_restart_sequence(rcon, cfg, logger, immediate=immediate)
+        run_restart_sequence(rcon, cfg, logger, immediate=immediate, shutdown=_shutdown)
     except (OSError, RconError) as exc:
         logger.log(f"RCON error during restart sequence: {exc}")
 
@@ -122,15 +133,21 @@ def main() -> int:
     )
     args = parser.parse_args()
 
+    signal.signal(signal.SIGINT, _request_shutdown)
+    signal.signal(signal.SIGTERM, _request_shutdown)
+
     cfg = load_config(Path(args.config), Path(args.rcon))
     logger = Logger(cfg.log_path)
 
     logger.log("Monitor started.")
-    while True:
+    while not _shutdown.is_set():
         run_once(cfg, logger)
         if args.once:
             break
-        time.sleep(cfg.check_interval_sec)
+        # Interruptible wait: SIGINT/SIGTERM sets the event and ends the
+        # loop immediately instead of after up to check_interval_sec.
+        if _shutdown.wait(cfg.check_interval_sec):
+            break
 
     logger.log("Monitor stopped.")
     return 0
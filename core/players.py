@@ -6,11 +6,14 @@ from typing import Optional
 from .rcon_client import RconClient
 
 
+_PLAYER_COUNT_RE = re.compile(r"Players connected\s*\((\d+)\)", re.IGNORECASE)
+
+
 def parse_player_count(response: str) -> Optional[int]:
     if not response:
         return None
 
-    match = re.search(r"Players connected\s*\((\d+)\)", response, re.IGNORECASE)
+    match = _PLAYER_COUNT_RE.search(response)
     if match:
         return int(match.group(1))
 
@@ -1,38 +1,45 @@
 from __future__ import annotations
 
+import select
 import socket
 import struct
+import time
 
 
 class RconError(RuntimeError):
     pass
 
 
-def _recv_exact(sock: socket.socket, length: int) -> bytes:
-    chunks = []
-    remaining = length
-    while remaining > 0:
-        chunk = sock.recv(remaining)
-        if not chunk:
+def _recv_exact(sock: socket.socket, length: int) -> bytearray:
+    # Preallocate once and recv_into it, instead of collecting chunk bytes
+    # objects and joining them.
+    buf = bytearray(length)
+    view = memoryview(buf)
+    offset = 0
+    while offset < length:
+        received = sock.recv_into(view[offset:])
+        if received == 0:
             raise RconError("Connection closed by server")
-        chunks.append(chunk)
-        remaining -= len(chunk)
-    return b"".join(chunks)
+        offset += received
+    return buf
 
 
 def _recv_packet(sock: socket.socket):
     raw_len = _recv_exact(sock, 4)
-    (length,) = struct.unpack("<i", raw_len)
+    (length,) = struct.unpack_from("<i", raw_len)
     payload = _recv_exact(sock, length)
-    req_id, packet_type = struct.unpack("<ii", payload[:8])
-    body = payload[8:-2]
+    req_id, packet_type = struct.unpack_from("<ii", payload)
+    body = bytes(payload[8:-2])
     return req_id, packet_type, body
 
 
 def _send_packet(sock: socket.socket, req_id: int, packet_type: int, body: str) -> None:
     body_bytes = body.encode("utf-8")
-    packet = struct.pack("<iii", len(body_bytes) + 10, req_id, packet_type)
-    packet += body_bytes + b"\x00\x00"
+    # "2x" emits the two trailing null bytes, so the whole packet is
+    # assembled in one pack call instead of two buffers plus a concat.
+    packet = struct.pack(
+        f"<iii{len(body_bytes)}s2x", len(body_bytes) + 10, req_id, packet_type, body_bytes
+    )
     sock.sendall(packet)
 
 
@@ -52,17 +59,67 @@ class RconClient:
         self._port = port
         self._password = password
         self._timeout = timeout
+        self._sock: "socket.socket | None" = None
+        self._req_id = 1
 
-    def send_command(self, command: str) -> str:
-        with socket.create_connection((self._host, self._port), timeout=self._timeout) as sock:
-            sock.settimeout(self._timeout)
-            if not _authenticate(sock, self._password):
-                raise RconError("RCON auth failed")
-            _send_packet(sock, 2, 2, command)  # SERVERDATA_EXECCOMMAND
+    def __enter__(self) -> "RconClient":
+        self._sock = self._connect()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            finally:
+                self._sock = None
+
+    def _connect(self) -> socket.socket:
+        sock = socket.create_connection((self._host, self._port), timeout=self._timeout)
+        sock.settimeout(self._timeout)
+        if not _authenticate(sock, self._password):
+            sock.close()
+            raise RconError("RCON auth failed")
+        return sock
+
+    def _next_req_id(self) -> int:
+        self._req_id += 1
+        return self._req_id
+
+    def _send_command_on(self, sock: socket.socket, command: str) -> str:
+        req_id = self._next_req_id()
+        sentinel_id = self._next_req_id()
+        _send_packet(sock, req_id, 2, command)  # SERVERDATA_EXECCOMMAND
+        # Standard multi-packet trick: the empty follow-up command is echoed
+        # back after the real response, so its reply marks end-of-response
+        # without waiting out the socket timeout.
+        _send_packet(sock, sentinel_id, 2, "")
+
+        parts = []
+        deadline = time.monotonic() + self._timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            ready, _, _ = select.select([sock], [], [], remaining)
+            if not ready:
+                break
             try:
-                req_id, packet_type, body = _recv_packet(sock)
-                if packet_type not in (0, 2):
-                    raise RconError(f"Unexpected packet type {packet_type}")
-                return body.decode("utf-8", errors="replace")
+                packet_id, packet_type, body = _recv_packet(sock)
             except socket.timeout:
-                return ""
+                break
+            if packet_type not in (0, 2):
+                raise RconError(f"Unexpected packet type {packet_type}")
+            if packet_id == sentinel_id:
+                break
+            if packet_id == req_id:
+                parts.append(body)
+        return b"".join(parts).decode("utf-8", errors="replace")
+
+    def send_command(self, command: str) -> str:
+        if self._sock is not None:
+            return self._send_command_on(self._sock, command)
+        with self._connect() as sock:
+            return self._send_command_on(sock, command)
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict
+
+
+_BASE_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_CACHE_DIR = _BASE_DIR / ".cache"
+DEFAULT_CACHE_PATH = DEFAULT_CACHE_DIR / "workshop.json"
+
+
+def load_json_cache(cache_path: Path) -> dict:
+    try:
+        with cache_path.open("r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    return data
+
+
+def save_json_cache(entries: dict, cache_path: Path) -> None:
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=str(cache_path.parent), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entries, f)
+            os.replace(tmp_name, cache_path)
+        except OSError:
+            os.unlink(tmp_name)
+            raise
+    except OSError:
+        pass
+
+
+def load_remote_cache(cache_path: Path = DEFAULT_CACHE_PATH) -> Dict[str, dict]:
+    data = load_json_cache(cache_path)
+    return {str(k): v for k, v in data.items() if isinstance(v, dict)}
+
+
+def save_remote_cache(entries: Dict[str, dict], cache_path: Path = DEFAULT_CACHE_PATH) -> None:
+    save_json_cache(entries, cache_path)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import threading
 import time
+from typing import Optional
 
 from .config import MonitorConfig
 from .logger import Logger
@@ -12,10 +14,15 @@ def _send_servermsg(rcon: RconClient, text: str) -> None:
     rcon.send_command(command)
 
 
-def _sleep_seconds(total_seconds: int) -> None:
+def _wait_seconds(total_seconds: int, shutdown: Optional[threading.Event]) -> bool:
+    """Wait up to total_seconds; return True if shutdown was requested."""
+    if shutdown is None:
+        if total_seconds > 0:
+            time.sleep(total_seconds)
+        return False
     if total_seconds <= 0:
-        return
-    time.sleep(total_seconds)
+        return shutdown.is_set()
+    return shutdown.wait(total_seconds)
 
 
 def run_restart_sequence(
@@ -23,6 +30,18 @@ def run_restart_sequence(
     cfg: MonitorConfig,
     logger: Logger,
     immediate: bool,
+    shutdown: Optional[threading.Event] = None,
+) -> None:
+    with rcon:
+        _run_restart_sequence(rcon, cfg, logger, immediate, shutdown)
+
+
+def _run_restart_sequence(
+    rcon: RconClient,
+    cfg: MonitorConfig,
+    logger: Logger,
+    immediate: bool,
+    shutdown: Optional[threading.Event],
 ) -> None:
     if immediate:
         logger.log("No players online. Restarting immediately.")
@@ -37,12 +56,16 @@ def run_restart_sequence(
     logger.log(f"Restart scheduled in {delay} seconds.")
     _send_servermsg(rcon, cfg.msg_restart_5min)
 
-    _sleep_seconds(delay - warn_1)
+    if _wait_seconds(delay - warn_1, shutdown):
+        logger.log("Shutdown requested. Restart sequence aborted.")
+        return
 
     if warn_1 > 0:
         _send_servermsg(rcon, cfg.msg_restart_1min)
 
-    _sleep_seconds(warn_1 - countdown)
+    if _wait_seconds(warn_1 - countdown, shutdown):
+        logger.log("Shutdown requested. Restart sequence aborted.")
+        return
 
     if countdown > 0:
         for remaining in range(countdown, 0, -1):
@@ -51,7 +74,9 @@ def run_restart_sequence(
             except Exception:
                 message = f"Restart in {remaining} seconds."
             _send_servermsg(rcon, message)
-            time.sleep(1)
+            if _wait_seconds(1, shutdown):
+                logger.log("Shutdown requested. Restart sequence aborted.")
+                return
 
     rcon.send_command(cfg.save_command)
     rcon.send_command(cfg.quit_command)
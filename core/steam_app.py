@@ -1,15 +1,26 @@
 from __future__ import annotations
 
+import hashlib
+import os
 import re
-import subprocess
+import signal
+import threading
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
 from .utils import read_text
 
 
 SERVER_APP_ID = 380870
 
+# Digest of the last dump written; steamcmd output is identical between
+# checks in steady state, so matching digests skip the rewrite.
+_LAST_DUMP_HASH: Optional[bytes] = None
+
+_MANIFEST_FIELD_RE = re.compile(r'(?m)^\s*"(buildid|LastUpdated)"\s*"(\d+)"\s*$')
+_BUILDID_RE = re.compile(r'(?im)^\s*"buildid"\s*"(\d+)"\s*$')
+_BUILDID_LINE_RE = re.compile(r'"buildid"\s*"(\d+)"\s*$', re.IGNORECASE)
+
 
 def parse_appmanifest_build_info(appmanifest_path: Path) -> Tuple[Optional[str], Optional[int]]:
     if not appmanifest_path.exists():
@@ -19,17 +30,36 @@ def parse_appmanifest_build_info(appmanifest_path: Path) -> Tuple[Optional[str],
     buildid = None
     lastupdated = None
 
-    build_match = re.search(r'(?m)^\s*"buildid"\s*"(\d+)"\s*$', text)
-    if build_match:
-        buildid = build_match.group(1)
-
-    updated_match = re.search(r'(?m)^\s*"LastUpdated"\s*"(\d+)"\s*$', text)
-    if updated_match:
-        lastupdated = int(updated_match.group(1))
+    for match in _MANIFEST_FIELD_RE.finditer(text):
+        if match.group(1) == "buildid":
+            if buildid is None:
+                buildid = match.group(2)
+        elif lastupdated is None:
+            lastupdated = int(match.group(2))
+        if buildid is not None and lastupdated is not None:
+            break
 
     return buildid, lastupdated
 
 
+def _scan_balanced_block(text: str, start: int) -> Optional[str]:
+    depth = 1
+    i = start
+    while True:
+        opening = text.find("{", i + 1)
+        closing = text.find("}", i + 1)
+        if closing == -1:
+            return None
+        if opening != -1 and opening < closing:
+            depth += 1
+            i = opening
+        else:
+            depth -= 1
+            i = closing
+            if depth == 0:
+                return text[start : i + 1]
+
+
 def _extract_named_block(text: str, name: str) -> Optional[str]:
     pos = text.find(f'"{name}"')
     if pos == -1:
@@ -39,16 +69,7 @@ def _extract_named_block(text: str, name: str) -> Optional[str]:
     if start == -1:
         return None
 
-    depth = 0
-    for i in range(start, len(text)):
-        ch = text[i]
-        if ch == "{":
-            depth += 1
-        elif ch == "}":
-            depth -= 1
-            if depth == 0:
-                return text[start : i + 1]
-    return None
+    return _scan_balanced_block(text, start)
 
 
 def _extract_branch_block(text: str, branch_name: str) -> Optional[str]:
@@ -64,25 +85,52 @@ def _extract_branch_block(text: str, branch_name: str) -> Optional[str]:
     if start == -1:
         return None
 
-    depth = 0
-    for i in range(start, len(branches_block)):
-        ch = branches_block[i]
-        if ch == "{":
-            depth += 1
-        elif ch == "}":
-            depth -= 1
-            if depth == 0:
-                return branches_block[start : i + 1]
-    return None
+    return _scan_balanced_block(branches_block, start)
 
 
 def _parse_buildid(text: str) -> Optional[str]:
-    match = re.search(r'(?im)^\s*"buildid"\s*"(\d+)"\s*$', text)
+    match = _BUILDID_RE.search(text)
     if match:
         return match.group(1)
     return None
 
 
+class _BranchBuildidScanner:
+    """Incremental match for the branch buildid in streamed steamcmd lines.
+
+    Assumes the usual app_info_print layout: one token per line, braces on
+    their own lines. The buffered extractors stay as the fallback.
+    """
+
+    def __init__(self, branch: str) -> None:
+        self._branch_token = f'"{branch}"'
+        self._stage = 0  # 0: before "branches", 1: inside it, 2: inside target branch
+        self._depth = 0
+
+    def feed(self, line: str) -> Optional[str]:
+        stripped = line.strip()
+        if self._stage == 0:
+            if stripped.startswith('"branches"'):
+                self._stage = 1
+                self._depth = 0
+        elif stripped == "{":
+            self._depth += 1
+        elif stripped == "}":
+            self._depth -= 1
+            if self._stage == 2 and self._depth <= 1:
+                self._stage = 1
+            if self._depth <= 0:
+                self._stage = 0
+        elif self._stage == 1:
+            if self._depth == 1 and stripped.startswith(self._branch_token):
+                self._stage = 2
+        else:
+            match = _BUILDID_LINE_RE.match(stripped)
+            if match:
+                return match.group(1)
+        return None
+
+
 def steamcmd_get_buildid(
     steamcmd_path: Path,
     app_id: int,
@@ -90,6 +138,10 @@ def steamcmd_get_buildid(
     timeout: int,
     dump_path: Optional[Path],
 ) -> Tuple[Optional[str], Optional[str]]:
+    # Deferred: keeps the subprocess machinery out of cold starts that
+    # never reach a steamcmd run.
+    import subprocess
+
     steamcmd_path = steamcmd_path.resolve()
     if not steamcmd_path.exists():
         return None, f"steamcmd not found: {steamcmd_path}"
@@ -106,29 +158,95 @@ def steamcmd_get_buildid(
     ]
 
     try:
-        proc = subprocess.run(
+        # A new session makes the child a process-group leader, so the
+        # timeout can kill the whole group: steamcmd is usually a shell
+        # wrapper whose grandchildren would otherwise keep the pipe open.
+        proc = subprocess.Popen(
             cmd,
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             text=True,
-            timeout=timeout,
             encoding="utf-8",
             errors="replace",
+            bufsize=1 << 16,
+            start_new_session=(os.name == "posix"),
         )
     except Exception as exc:
         return None, f"steamcmd failed: {exc}"
 
-    output = (proc.stdout or "") + "\n" + (proc.stderr or "")
+    timed_out = threading.Event()
+
+    def _kill_on_timeout() -> None:
+        timed_out.set()
+        if os.name == "posix":
+            try:
+                os.killpg(proc.pid, signal.SIGKILL)
+            except OSError:
+                proc.kill()
+        else:
+            proc.kill()
+        # Closing our read end unblocks the reader even if some detached
+        # grandchild survived with the write end open.
+        if proc.stdout is not None:
+            try:
+                proc.stdout.close()
+            except OSError:
+                pass
+
+    watchdog = threading.Timer(timeout, _kill_on_timeout)
+    watchdog.start()
+
+    buildid = None
+    scanner = _BranchBuildidScanner(branch)
+    # Lines are teed for the dump and the buffered fallbacks only when a
+    # dump is requested; otherwise the stream is scanned and dropped.
+    collect = dump_path is not None
+    lines: List[str] = []
+    try:
+        assert proc.stdout is not None
+        for line in proc.stdout:
+            if collect:
+                lines.append(line)
+            buildid = scanner.feed(line)
+            if buildid:
+                proc.terminate()
+                break
+    except Exception as exc:
+        proc.kill()
+        proc.wait()
+        if timed_out.is_set():
+            return None, f"steamcmd failed: timed out after {timeout}s"
+        return None, f"steamcmd failed: {exc}"
+    finally:
+        watchdog.cancel()
+
+    proc.wait()
+
+    output = "".join(lines)
 
     if dump_path:
-        try:
-            dump_path.parent.mkdir(parents=True, exist_ok=True)
-            dump_path.write_text(
-                f"ReturnCode: {proc.returncode}\nCommand: {' '.join(cmd)}\n\n{output}",
-                encoding="utf-8",
-                errors="replace",
-            )
-        except Exception:
-            pass
+        global _LAST_DUMP_HASH
+        digest = hashlib.blake2b(
+            output.encode("utf-8", "replace"), digest_size=16
+        ).digest()
+        if digest != _LAST_DUMP_HASH:
+            try:
+                dump_path.parent.mkdir(parents=True, exist_ok=True)
+                dump_path.write_text(
+                    f"ReturnCode: {proc.returncode}\nCommand: {' '.join(cmd)}\n\n{output}",
+                    encoding="utf-8",
+                    errors="replace",
+                )
+            except Exception:
+                pass
+            else:
+                _LAST_DUMP_HASH = digest
+
+    if timed_out.is_set():
+        return None, f"steamcmd failed: timed out after {timeout}s"
+
+    if buildid:
+        return buildid, None
 
     branch_block = _extract_branch_block(output, branch_name=branch)
     if branch_block:
@@ -136,6 +254,12 @@ def steamcmd_get_buildid(
         if buildid:
             return buildid, None
 
+    # Fallback scan for any buildid: app_info data sits near the top of the
+    # dump, so try a bounded prefix before sweeping the whole output.
+    match = _BUILDID_RE.search(output, 0, min(len(output), 65536))
+    if match:
+        return match.group(1), None
+
     buildid = _parse_buildid(output)
     if buildid:
         return buildid, None
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Optional, Tuple
 
+from .remote_cache import DEFAULT_CACHE_DIR, load_json_cache, save_json_cache
 from .steam_app import SERVER_APP_ID, parse_appmanifest_build_info, steamcmd_get_buildid
 from .workshop import ModStatus, build_mod_statuses
 
 
+UPDATES_CACHE_PATH = DEFAULT_CACHE_DIR / "updates.json"
+
+
 @dataclass
 class UpdateResult:
     mods_outdated: bool
@@ -23,6 +29,24 @@ class UpdateResult:
         return self.mods_outdated or self.server_outdated
 
 
+def _cached_remote_buildid(
+    appmanifest_mtime_ns: Optional[int],
+    steamcmd_ttl_sec: int,
+) -> Optional[str]:
+    if appmanifest_mtime_ns is None or steamcmd_ttl_sec <= 0:
+        return None
+    cache = load_json_cache(UPDATES_CACHE_PATH)
+    if cache.get("appmanifest_mtime_ns") != appmanifest_mtime_ns:
+        return None
+    checked_at = cache.get("checked_at")
+    if not isinstance(checked_at, (int, float)):
+        return None
+    if time.time() - checked_at > steamcmd_ttl_sec:
+        return None
+    remote_buildid = cache.get("remote_buildid")
+    return remote_buildid if isinstance(remote_buildid, str) else None
+
+
 def check_updates(
     ini_path: Path,
     steamapps_dir: Path,
@@ -31,23 +55,58 @@ def check_updates(
     steam_api_timeout_sec: int,
     steamcmd_timeout_sec: int,
     steamcmd_dump_path: Optional[Path],
+    steamcmd_ttl_sec: int = 0,
 ) -> UpdateResult:
-    mod_statuses = build_mod_statuses(
-        ini_path=ini_path,
-        steamapps_dir=steamapps_dir,
-        timeout=steam_api_timeout_sec,
-    )
-    mods_outdated = any(status.is_outdated for status in mod_statuses)
-
     appmanifest_path = steamapps_dir / f"appmanifest_{SERVER_APP_ID}.acf"
     local_buildid, _ = parse_appmanifest_build_info(appmanifest_path)
-    remote_buildid, steamcmd_error = steamcmd_get_buildid(
-        steamcmd_path=steamcmd_path,
-        app_id=SERVER_APP_ID,
-        branch=steam_branch,
-        timeout=steamcmd_timeout_sec,
-        dump_path=steamcmd_dump_path,
-    )
+    try:
+        appmanifest_mtime_ns = appmanifest_path.stat().st_mtime_ns
+    except OSError:
+        appmanifest_mtime_ns = None
+
+    # If the appmanifest has not changed since the last real steamcmd run
+    # and that run is recent enough, its remote buildid is still good:
+    # skip the multi-second subprocess entirely.
+    cached_remote_buildid = _cached_remote_buildid(appmanifest_mtime_ns, steamcmd_ttl_sec)
+
+    # The mod-status build (Steam HTTP + filesystem) and the steamcmd
+    # subprocess are independent, so overlap them instead of waiting serially.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        statuses_future = executor.submit(
+            build_mod_statuses,
+            ini_path=ini_path,
+            steamapps_dir=steamapps_dir,
+            timeout=steam_api_timeout_sec,
+        )
+        if cached_remote_buildid is not None:
+            buildid_future = None
+        else:
+            buildid_future = executor.submit(
+                steamcmd_get_buildid,
+                steamcmd_path=steamcmd_path,
+                app_id=SERVER_APP_ID,
+                branch=steam_branch,
+                timeout=steamcmd_timeout_sec,
+                dump_path=steamcmd_dump_path,
+            )
+        mod_statuses = statuses_future.result()
+        if buildid_future is None:
+            remote_buildid, steamcmd_error = cached_remote_buildid, None
+        else:
+            remote_buildid, steamcmd_error = buildid_future.result()
+
+    if buildid_future is not None and remote_buildid and appmanifest_mtime_ns is not None:
+        save_json_cache(
+            {
+                "appmanifest_mtime_ns": appmanifest_mtime_ns,
+                "local_buildid": local_buildid,
+                "remote_buildid": remote_buildid,
+                "checked_at": time.time(),
+            },
+            UPDATES_CACHE_PATH,
+        )
+
+    mods_outdated = any(status.is_outdated for status in mod_statuses)
 
     server_outdated = False
     if local_buildid and remote_buildid and local_buildid != remote_buildid:
@@ -1,13 +1,24 @@
 from __future__ import annotations
 
-import datetime as dt
 import time
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
+
+
+# (unix second, formatted string); log bursts within the same wall-second
+# reuse the formatted value instead of re-running strftime.
+_NOW_CACHE: Tuple[int, str] = (0, "")
 
 
 def now_str() -> str:
-    return dt.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    global _NOW_CACHE
+    second = int(time.time())
+    cached = _NOW_CACHE
+    if cached[0] == second:
+        return cached[1]
+    value = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second))
+    _NOW_CACHE = (second, value)
+    return value
 
 
 def read_text(path: Path) -> str:
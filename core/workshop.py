@@ -1,17 +1,20 @@
 from __future__ import annotations
 
-import json
+import os
 import re
-import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from .remote_cache import load_remote_cache, save_remote_cache
 from .utils import read_text
 
 
 WORKSHOP_APP_ID = 108600
 
+_WORKSHOP_ITEMS_RE = re.compile(r"(?im)^\s*WorkshopItems\s*=\s*(.+?)\s*$")
+
 
 @dataclass
 class ModRemoteInfo:
@@ -42,39 +45,33 @@ def parse_workshop_ids_from_ini(ini_path: Path) -> List[str]:
         raise FileNotFoundError(f"Missing ini file: {ini_path}")
 
     content = read_text(ini_path)
-    match = re.search(r"(?im)^\s*WorkshopItems\s*=\s*(.+?)\s*$", content)
+    match = _WORKSHOP_ITEMS_RE.search(content)
     if not match:
         return []
 
     raw = match.group(1).strip()
-    parts = [p.strip() for p in raw.split(";") if p.strip()]
-    seen = set()
-    out: List[str] = []
-    for part in parts:
-        if part.isdigit() and part not in seen:
-            seen.add(part)
-            out.append(part)
-    return out
-
-
-def _urlencode(value: str) -> str:
-    from urllib.parse import quote_plus
-
-    return quote_plus(str(value))
+    # dict.fromkeys dedupes in C while preserving first-seen order.
+    return list(
+        dict.fromkeys(p for p in (x.strip() for x in raw.split(";")) if p.isdigit())
+    )
 
 
 def fetch_published_details(workshop_ids: List[str], timeout: int = 25) -> Dict[str, ModRemoteInfo]:
     if not workshop_ids:
         return {}
 
+    # Deferred: urllib.request and json are only paid for when there is
+    # actually something to ask Steam about.
+    import json
+    import urllib.request
+    from urllib.parse import urlencode
+
     url = "https://api.steampowered.com/ISteamRemoteStorage/GetPublishedFileDetails/v1/"
     form_pairs = [("itemcount", str(len(workshop_ids)))]
     for i, wid in enumerate(workshop_ids):
         form_pairs.append((f"publishedfileids[{i}]", wid))
 
-    data = "&".join(
-        [f"{_urlencode(k)}={_urlencode(v)}" for k, v in form_pairs]
-    ).encode("utf-8")
+    data = urlencode(form_pairs).encode("utf-8")
 
     req = urllib.request.Request(url, data=data, method="POST")
     req.add_header("Content-Type", "application/x-www-form-urlencoded; charset=UTF-8")
@@ -112,15 +109,19 @@ def get_local_mod_mtime(steamapps_dir: Path, workshop_id: str) -> Optional[int]:
     mods_dir = base / "mods"
     mtimes: List[int] = []
 
-    if mods_dir.exists():
-        for mod_folder in mods_dir.iterdir():
-            if not mod_folder.is_dir():
-                continue
-            mod_info = mod_folder / "mod.info"
-            if mod_info.exists():
-                mtimes.append(int(mod_info.stat().st_mtime))
-            else:
-                mtimes.append(int(mod_folder.stat().st_mtime))
+    try:
+        with os.scandir(mods_dir) as entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+                try:
+                    mod_info_stat = os.stat(os.path.join(entry.path, "mod.info"))
+                except OSError:
+                    mtimes.append(int(entry.stat().st_mtime))
+                else:
+                    mtimes.append(int(mod_info_stat.st_mtime))
+    except OSError:
+        pass
 
     if mtimes:
         return max(mtimes)
@@ -135,12 +136,54 @@ def build_mod_statuses(
     timeout: int,
 ) -> List[ModStatus]:
     workshop_ids = parse_workshop_ids_from_ini(ini_path)
-    remote_map = fetch_published_details(workshop_ids, timeout=timeout)
+
+    # The per-mod stat walks are independent I/O waits, so fan them out.
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        local_mtimes = list(
+            executor.map(
+                lambda wid: get_local_mod_mtime(steamapps_dir, wid),
+                workshop_ids,
+            )
+        )
+
+    # Mods whose cached remote time_updated already exceeds the local mtime
+    # are known-outdated until steamcmd re-downloads them; re-asking Steam
+    # about them every poll tells us nothing new.
+    cache = load_remote_cache()
+    remote_map: Dict[str, ModRemoteInfo] = {}
+    fetch_ids: List[str] = []
+    for wid, local_mtime in zip(workshop_ids, local_mtimes):
+        entry = cache.get(wid)
+        cached_updated = entry.get("time_updated") if entry else None
+        if (
+            entry is not None
+            and cached_updated is not None
+            and local_mtime is not None
+            and cached_updated > local_mtime
+        ):
+            remote_map[wid] = ModRemoteInfo(
+                workshop_id=wid,
+                title=entry.get("title"),
+                time_updated=cached_updated,
+                result=1,
+            )
+        else:
+            fetch_ids.append(wid)
+
+    if fetch_ids:
+        fetched = fetch_published_details(fetch_ids, timeout=timeout)
+        remote_map.update(fetched)
+        for wid, remote in fetched.items():
+            if remote.result == 1 and remote.time_updated is not None:
+                cache[wid] = {
+                    "time_updated": remote.time_updated,
+                    "title": remote.title,
+                }
+        save_remote_cache(cache)
 
     statuses: List[ModStatus] = []
-    for wid in workshop_ids:
+    for wid, local_mtime in zip(workshop_ids, local_mtimes):
         remote = remote_map.get(wid)
-        local_mtime = get_local_mod_mtime(steamapps_dir, wid)
         statuses.append(
             ModStatus(
                 workshop_id=wid,
@@ -25,20 +25,33 @@ python pz_check_versions.py --ini "Zomboid\\Server\\servertest.ini" --steamapps
 from __future__ import annotations
 
 import argparse
+import atexit
 import datetime as dt
+import functools
+import http.client
 import json
+import os
 import re
 import subprocess
+import threading
 import time
-import urllib.request
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlencode
 
 
 WORKSHOP_APP_ID = 108600  # Workshop/контент Project Zomboid
 SERVER_APP_ID = 380870  # Project Zomboid Dedicated Server
 
+_SCRIPT_DIR = Path(__file__).resolve().parent
+
+# Кэш ответа PublishedFileDetails: повторные запуски в течение TTL
+# не ходят в Steam вообще.
+_PFD_CACHE_PATH = _SCRIPT_DIR / "steam_pfd_cache.json"
+_PFD_CACHE_TTL_SEC = 300
+
 
 @dataclass
 class ModLocalInfo:
@@ -62,14 +75,30 @@ class ModRemoteInfo:
 
 def _now_str() -> str:
 	"""Текущее время для логов."""
-	return dt.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+	# isoformat даёт тот же "YYYY-MM-DD HH:MM:SS" без разбора format-строки
+	return dt.datetime.now().isoformat(" ", "seconds")
+
+
+class Logger:
+	"""Лог-файл, открытый один раз на весь запуск (вместо open/close на строку)."""
+
+	def __init__(self, log_path: Path) -> None:
+		log_path.parent.mkdir(parents=True, exist_ok=True)
+		self._fh = log_path.open("a", encoding="utf-8", buffering=1)
+		atexit.register(self.close)
 
+	def info(self, line: str) -> None:
+		self._fh.write(line.rstrip() + "\n")
 
-def _write_log_line(log_path: Path, line: str) -> None:
-	"""Дописать строку в лог."""
-	log_path.parent.mkdir(parents=True, exist_ok=True)
-	with log_path.open("a", encoding="utf-8") as f:
-		f.write(line.rstrip() + "\n")
+	def info_many(self, lines: List[str]) -> None:
+		"""Пишет блок строк одним вызовом write."""
+		if lines:
+			self._fh.write("\n".join(line.rstrip() for line in lines) + "\n")
+
+	def close(self) -> None:
+		if not self._fh.closed:
+			self._fh.flush()
+			self._fh.close()
 
 
 def _read_text_file(path: Path) -> str:
@@ -89,23 +118,38 @@ def parse_workshop_ids_from_ini(ini_path: Path) -> List[str]:
 	if not ini_path.exists():
 		raise FileNotFoundError(f"INI не найден: {ini_path}")
 
-	content = _read_text_file(ini_path)
-
-	m = re.search(r"(?im)^\s*WorkshopItems\s*=\s*(.+?)\s*$", content)
-	if not m:
+	# Построчное чтение: нужная строка одна, весь INI в память не грузим
+	raw = None
+	with ini_path.open("r", encoding="utf-8", errors="replace") as f:
+		for line in f:
+			s = line.lstrip()
+			if s[:13].lower() != "workshopitems":
+				continue
+			rest = s[13:].lstrip()
+			if rest.startswith("="):
+				raw = rest[1:].strip()
+				break
+
+	if raw is None:
 		return []
 
-	raw = m.group(1).strip()
 	parts = [p.strip() for p in raw.split(";") if p.strip()]
 
-	seen = set()
-	out: List[str] = []
-	for p in parts:
-		if p.isdigit() and p not in seen:
-			seen.add(p)
-			out.append(p)
+	# dict.fromkeys — упорядоченная дедупликация одним проходом на уровне C
+	return [p for p in dict.fromkeys(parts) if p.isdigit()]
 
-	return out
+
+# Скомпилированы один раз: parse_version_from_mod_info зовётся на каждый
+# локальный мод.
+_VERSION_RES = tuple(re.compile(p) for p in (
+	r"(?im)^\s*version\s*=\s*(.+?)\s*$",
+	r"(?im)^\s*modversion\s*=\s*(.+?)\s*$",
+	r"(?im)^\s*workshopversion\s*=\s*(.+?)\s*$",
+	r"(?im)^\s*build\s*=\s*(.+?)\s*$",
+))
+
+_BUILDID_I_RE = re.compile(r'(?im)^\s*"buildid"\s*"(\d+)"\s*$')
+_BUILDID_B_RE = re.compile(rb'(?im)^\s*"buildid"\s*"(\d+)"\s*$')
 
 
 def parse_version_from_mod_info(mod_info_text: str) -> Optional[str]:
@@ -115,14 +159,8 @@ def parse_version_from_mod_info(mod_info_text: str) -> Optional[str]:
 	Многие моды не хранят версию явно.
 	Пробуем типовые ключи.
 	"""
-	patterns = [
-		r"(?im)^\s*version\s*=\s*(.+?)\s*$",
-		r"(?im)^\s*modversion\s*=\s*(.+?)\s*$",
-		r"(?im)^\s*workshopversion\s*=\s*(.+?)\s*$",
-		r"(?im)^\s*build\s*=\s*(.+?)\s*$",
-	]
-	for pat in patterns:
-		m = re.search(pat, mod_info_text)
+	for rx in _VERSION_RES:
+		m = rx.search(mod_info_text)
 		if m:
 			val = m.group(1).strip().strip('"').strip("'")
 			return val if val else None
@@ -149,26 +187,34 @@ def find_local_mod_infos(steamapps_dir: Path, workshop_id: str) -> List[ModLocal
 		))
 		return out
 
-	for mod_folder in sorted([p for p in mods_dir.iterdir() if p.is_dir()]):
+	# os.scandir отдаёт DirEntry с закэшированными is_dir/stat —
+	# меньше stat-сисколлов, чем iterdir + is_dir + stat
+	with os.scandir(mods_dir) as it:
+		entries = sorted((e for e in it if e.is_dir()), key=lambda e: e.name)
+
+	for entry in entries:
+		mod_folder = Path(entry.path)
 		mod_info = mod_folder / "mod.info"
-		if mod_info.exists():
-			text = _read_text_file(mod_info)
-			local_ver = parse_version_from_mod_info(text)
-			mtime = int(mod_info.stat().st_mtime)
+		try:
+			info_stat = os.stat(mod_info)
+		except OSError:
+			mtime = int(entry.stat().st_mtime)
 			out.append(ModLocalInfo(
 				workshop_id=workshop_id,
 				mod_dir=mod_folder,
-				mod_info_path=mod_info,
-				local_version=local_ver,
+				mod_info_path=None,
+				local_version=None,
 				local_mtime=mtime
 			))
 		else:
-			mtime = int(mod_folder.stat().st_mtime)
+			text = _read_text_file(mod_info)
+			local_ver = parse_version_from_mod_info(text)
+			mtime = int(info_stat.st_mtime)
 			out.append(ModLocalInfo(
 				workshop_id=workshop_id,
 				mod_dir=mod_folder,
-				mod_info_path=None,
-				local_version=None,
+				mod_info_path=mod_info,
+				local_version=local_ver,
 				local_mtime=mtime
 			))
 
@@ -184,34 +230,95 @@ def find_local_mod_infos(steamapps_dir: Path, workshop_id: str) -> List[ModLocal
 	return out
 
 
-def _urlencode(s: str) -> str:
-	"""URL encode для form-urlencoded."""
-	from urllib.parse import quote_plus
-	return quote_plus(str(s))
+_STEAM_API_HOST = "api.steampowered.com"
 
+# Keep-alive соединение на поток: TLS-рукопожатие делается один раз,
+# повторные POST идут по уже открытому сокету. threading.local нужен,
+# потому что батчи уходят в Steam из пула потоков.
+_steam_local = threading.local()
 
-def steam_get_published_file_details(workshop_ids: List[str], timeout: int = 25) -> Dict[str, ModRemoteInfo]:
-	"""
-	Запрашивает PublishedFileDetails у Steam для списка Workshop ID (без ключа).
-	Возвращает wid -> ModRemoteInfo.
-	"""
-	if not workshop_ids:
-		return {}
 
-	url = "https://api.steampowered.com/ISteamRemoteStorage/GetPublishedFileDetails/v1/"
+def _steam_api_post(path: str, data: bytes, timeout: int) -> bytes:
+	"""POST к Steam API с переиспользованием keep-alive соединения."""
+	headers = {
+		"Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
+		"Connection": "keep-alive",
+	}
+	last_error: Optional[Exception] = None
+	for attempt in range(2):
+		conn = getattr(_steam_local, "conn", None)
+		if conn is None:
+			conn = http.client.HTTPSConnection(_STEAM_API_HOST, timeout=timeout)
+			_steam_local.conn = conn
+		try:
+			conn.request("POST", path, body=data, headers=headers)
+			resp = conn.getresponse()
+			body = resp.read()
+		except (http.client.HTTPException, OSError) as e:
+			# Сервер мог закрыть keep-alive — переподключаемся один раз
+			conn.close()
+			_steam_local.conn = None
+			last_error = e
+			continue
+		if resp.status >= 400:
+			raise ConnectionError(f"Steam API HTTP {resp.status}")
+		return body
+	assert last_error is not None
+	raise last_error
+
 
+def _load_pfd_cache(workshop_ids: List[str]) -> Optional[Dict[str, ModRemoteInfo]]:
+	"""Читает кэш PublishedFileDetails, если он свежий и для того же набора ID."""
+	try:
+		payload = json.loads(_PFD_CACHE_PATH.read_text(encoding="utf-8"))
+	except (OSError, ValueError):
+		return None
+	if payload.get("ids") != sorted(workshop_ids):
+		return None
+	if time.time() - payload.get("ts", 0) >= _PFD_CACHE_TTL_SEC:
+		return None
+	items = payload.get("items")
+	if not isinstance(items, dict):
+		return None
+	out: Dict[str, ModRemoteInfo] = {}
+	for wid, item in items.items():
+		try:
+			out[str(wid)] = ModRemoteInfo(**item)
+		except TypeError:
+			return None
+	return out
+
+
+def _save_pfd_cache(workshop_ids: List[str], out: Dict[str, ModRemoteInfo]) -> None:
+	"""Сохраняет ответ PublishedFileDetails в кэш рядом со скриптом."""
+	payload = {
+		"ts": time.time(),
+		"ids": sorted(workshop_ids),
+		"items": {wid: asdict(info) for wid, info in out.items()},
+	}
+	try:
+		_PFD_CACHE_PATH.write_text(json.dumps(payload), encoding="utf-8")
+	except OSError:
+		pass
+
+
+# Очень длинные списки ID режем на батчи: один гигантский POST может
+# упереться в таймаут/лимиты, а батчи уходят параллельно.
+_PFD_BATCH_SIZE = 100
+
+
+def _fetch_pfd_batch(workshop_ids: List[str], timeout: int) -> Dict[str, ModRemoteInfo]:
+	"""Один POST GetPublishedFileDetails для батча Workshop ID."""
 	form_pairs = [("itemcount", str(len(workshop_ids)))]
 	for i, wid in enumerate(workshop_ids):
 		form_pairs.append((f"publishedfileids[{i}]", wid))
 
-	data = "&".join([f"{_urlencode(k)}={_urlencode(v)}" for k, v in form_pairs]).encode("utf-8")
+	data = urlencode(form_pairs).encode("ascii")
 
-	req = urllib.request.Request(url, data=data, method="POST")
-	req.add_header("Content-Type", "application/x-www-form-urlencoded; charset=UTF-8")
-
-	with urllib.request.urlopen(req, timeout=timeout) as resp:
-		raw = resp.read().decode("utf-8", errors="replace")
-		payload = json.loads(raw)
+	raw = _steam_api_post(
+		"/ISteamRemoteStorage/GetPublishedFileDetails/v1/", data, timeout
+	).decode("utf-8", errors="replace")
+	payload = json.loads(raw)
 
 	out: Dict[str, ModRemoteInfo] = {}
 	items = payload.get("response", {}).get("publishedfiledetails", [])
@@ -242,50 +349,135 @@ def steam_get_published_file_details(workshop_ids: List[str], timeout: int = 25)
 	return out
 
 
+def steam_get_published_file_details(workshop_ids: List[str], timeout: int = 25) -> Dict[str, ModRemoteInfo]:
+	"""
+	Запрашивает PublishedFileDetails у Steam для списка Workshop ID (без ключа).
+	Возвращает wid -> ModRemoteInfo.
+
+	Свежий (моложе _PFD_CACHE_TTL_SEC) ответ для того же набора ID берётся
+	из кэша без HTTP-запроса. Длинные списки режутся на батчи
+	по _PFD_BATCH_SIZE и запрашиваются параллельно.
+	"""
+	if not workshop_ids:
+		return {}
+
+	cached = _load_pfd_cache(workshop_ids)
+	if cached is not None:
+		return cached
+
+	chunks = [
+		workshop_ids[i:i + _PFD_BATCH_SIZE]
+		for i in range(0, len(workshop_ids), _PFD_BATCH_SIZE)
+	]
+
+	out: Dict[str, ModRemoteInfo] = {}
+	if len(chunks) == 1:
+		out = _fetch_pfd_batch(chunks[0], timeout)
+	else:
+		with ThreadPoolExecutor(max_workers=4) as ex:
+			for batch in ex.map(lambda c: _fetch_pfd_batch(c, timeout), chunks):
+				out.update(batch)
+
+	_save_pfd_cache(workshop_ids, out)
+	return out
+
+
+# buildid и LastUpdated лежат в начале ACF: читаем только первые 8 КБ
+# и вынимаем оба поля одним проходом
+_ACF_RE = re.compile(rb'"(buildid|LastUpdated)"\s*"(\d+)"')
+
+
 def parse_appmanifest_build_info(appmanifest_path: Path) -> Tuple[Optional[str], Optional[int]]:
 	"""
 	Парсит appmanifest_*.acf.
 
 	Возвращает (buildid, LastUpdated).
 	"""
-	if not appmanifest_path.exists():
+	try:
+		with appmanifest_path.open("rb") as f:
+			head = f.read(8192)
+	except OSError:
 		return None, None
 
-	text = _read_text_file(appmanifest_path)
+	vals = dict(_ACF_RE.findall(head))
 
-	buildid = None
-	lastupdated = None
+	buildid = vals.get(b"buildid", b"").decode("ascii") or None
+	lastupdated = int(vals[b"LastUpdated"]) if b"LastUpdated" in vals else None
 
-	mb = re.search(r'(?m)^\s*"buildid"\s*"(\d+)"\s*$', text)
-	if mb:
-		buildid = mb.group(1)
+	return buildid, lastupdated
 
-	ml = re.search(r'(?m)^\s*"LastUpdated"\s*"(\d+)"\s*$', text)
-	if ml:
-		lastupdated = int(ml.group(1))
 
-	return buildid, lastupdated
+_VDF_TOKEN_RE = re.compile(r'"((?:\\.|[^"\\])*)"|([{}])')
+
+
+def _parse_vdf(text: str) -> Dict:
+	"""
+	Однопроходный разбор VDF-подобного текста в вложенный словарь.
+
+	Неэкранированный мусор вне кавычек (логи steamcmd) просто пропускается.
+	"""
+	root: Dict = {}
+	stack: List[Dict] = [root]
+	key: Optional[str] = None
+	for m in _VDF_TOKEN_RE.finditer(text):
+		brace = m.group(2)
+		if brace == "{":
+			child: Dict = {}
+			if key is not None:
+				stack[-1][key] = child
+				key = None
+			stack.append(child)
+		elif brace == "}":
+			if len(stack) > 1:
+				stack.pop()
+			key = None
+		else:
+			token = m.group(1)
+			if key is None:
+				key = token
+			else:
+				stack[-1][key] = token
+				key = None
+	return root
+
+
+def _find_branch_buildid(node: Dict, branch: str) -> Optional[str]:
+	"""Ищет buildid ветки в дереве из _parse_vdf (рекурсивно, по ключу branches)."""
+	branches = node.get("branches")
+	if isinstance(branches, dict):
+		b = branches.get(branch)
+		if isinstance(b, dict):
+			v = b.get("buildid")
+			if isinstance(v, str) and v.isdigit():
+				return v
+	for v in node.values():
+		if isinstance(v, dict):
+			found = _find_branch_buildid(v, branch)
+			if found:
+				return found
+	return None
 
 
-def _extract_named_block(text: str, name: str) -> Optional[str]:
+def _extract_named_block(text: bytes, name: str) -> Optional[bytes]:
 	"""
 	Вырезает VDF-подобный блок по имени ("branches", "public", "unstable" и т.д.).
 	Работает по принципу: находим "name", затем первый '{' и балансируем скобки.
+	Работает прямо по байтам вывода steamcmd, без декодирования всего дампа.
 	"""
-	pos = text.find(f'"{name}"')
+	pos = text.find(f'"{name}"'.encode("utf-8"))
 	if pos == -1:
 		return None
 
-	start = text.find("{", pos)
+	start = text.find(b"{", pos)
 	if start == -1:
 		return None
 
 	depth = 0
 	for i in range(start, len(text)):
-		ch = text[i]
-		if ch == "{":
+		ch = text[i:i + 1]
+		if ch == b"{":
 			depth += 1
-		elif ch == "}":
+		elif ch == b"}":
 			depth -= 1
 			if depth == 0:
 				return text[start:i + 1]
@@ -293,7 +485,7 @@ def _extract_named_block(text: str, name: str) -> Optional[str]:
 	return None
 
 
-def _extract_branch_block(text: str, branch_name: str) -> Optional[str]:
+def _extract_branch_block(text: bytes, branch_name: str) -> Optional[bytes]:
 	"""
 	Пытается аккуратно вытащить блок конкретной ветки из блока "branches".
 	"""
@@ -302,20 +494,20 @@ def _extract_branch_block(text: str, branch_name: str) -> Optional[str]:
 		return None
 
 	# Ищем ветку внутри branches
-	pos = branches_block.find(f'"{branch_name}"')
+	pos = branches_block.find(f'"{branch_name}"'.encode("utf-8"))
 	if pos == -1:
 		return None
 
-	start = branches_block.find("{", pos)
+	start = branches_block.find(b"{", pos)
 	if start == -1:
 		return None
 
 	depth = 0
 	for i in range(start, len(branches_block)):
-		ch = branches_block[i]
-		if ch == "{":
+		ch = branches_block[i:i + 1]
+		if ch == b"{":
 			depth += 1
-		elif ch == "}":
+		elif ch == b"}":
 			depth -= 1
 			if depth == 0:
 				return branches_block[start:i + 1]
@@ -323,15 +515,56 @@ def _extract_branch_block(text: str, branch_name: str) -> Optional[str]:
 	return None
 
 
-def steamcmd_get_buildid(steamcmd_path: Path, app_id: int, branch: str = "public", timeout: int = 180) -> Tuple[Optional[str], Optional[Path]]:
+# Кэш buildid от steamcmd: сам запуск steamcmd занимает секунды,
+# свежее значение переиспользуем без запуска процесса.
+_STEAMCMD_CACHE_PATH = _SCRIPT_DIR / "steamcmd_buildid_cache.json"
+_STEAMCMD_CACHE_TTL_SEC = 300
+
+
+def _load_steamcmd_cache(app_id: int, branch: str) -> Optional[str]:
+	"""Читает закэшированный buildid для (app_id, branch), если он свежий."""
+	try:
+		payload = json.loads(_STEAMCMD_CACHE_PATH.read_text(encoding="utf-8"))
+	except (OSError, ValueError):
+		return None
+	entry = payload.get(f"{app_id}:{branch}")
+	if not isinstance(entry, dict):
+		return None
+	if time.time() - entry.get("ts", 0) >= _STEAMCMD_CACHE_TTL_SEC:
+		return None
+	buildid = entry.get("buildid")
+	return buildid if isinstance(buildid, str) and buildid.isdigit() else None
+
+
+def _save_steamcmd_cache(app_id: int, branch: str, buildid: str) -> None:
+	"""Сохраняет buildid для (app_id, branch) с отметкой времени."""
+	try:
+		payload = json.loads(_STEAMCMD_CACHE_PATH.read_text(encoding="utf-8"))
+	except (OSError, ValueError):
+		payload = {}
+	if not isinstance(payload, dict):
+		payload = {}
+	payload[f"{app_id}:{branch}"] = {"buildid": buildid, "ts": time.time()}
+	try:
+		_STEAMCMD_CACHE_PATH.write_text(json.dumps(payload), encoding="utf-8")
+	except OSError:
+		pass
+
+
+def _launch_steamcmd(steamcmd_path: Path, app_id: int, branch: str = "public", force: bool = False) -> Tuple[Optional[subprocess.Popen], Optional[str], Path]:
 	"""
-	Через steamcmd вытаскивает buildid указанной ветки для app_id.
+	Запускает steamcmd в фоне, не дожидаясь завершения.
 
-	Всегда пытается сохранить полный вывод steamcmd в dump-файл рядом со скриптом.
-	Если steamcmd не запускается, возвращает (None, dump_path) и пишет причину в dump.
+	Возвращает (процесс, buildid из кэша, dump_path): при свежем кэше или
+	ошибке запуска процесс равен None, результат забирает _finish_steamcmd.
 	"""
-	script_dir = Path(__file__).resolve().parent
-	dump_path = script_dir / f"steamcmd_appinfo_{app_id}.txt"
+	dump_path = _SCRIPT_DIR / f"steamcmd_appinfo_{app_id}.txt"
+
+	if not force:
+		cached = _load_steamcmd_cache(app_id, branch)
+		if cached is not None:
+			# dump остаётся от прошлого реального запуска
+			return None, cached, dump_path
 
 	# Нормализуем путь (особенно важно на Windows при относительных путях)
 	steamcmd_path = steamcmd_path.resolve()
@@ -341,7 +574,7 @@ def steamcmd_get_buildid(steamcmd_path: Path, app_id: int, branch: str = "public
 			dump_path.write_text(f"steamcmd.exe не найден по пути: {steamcmd_path}\n", encoding="utf-8", errors="replace")
 		except Exception:
 			pass
-		return None, dump_path
+		return None, None, dump_path
 
 	cmd = [
 		str(steamcmd_path),
@@ -352,50 +585,110 @@ def steamcmd_get_buildid(steamcmd_path: Path, app_id: int, branch: str = "public
 	]
 
 	try:
-		p = subprocess.run(
+		p = subprocess.Popen(
 			cmd,
-			capture_output=True,
-			text=True,
-			timeout=timeout,
-			encoding="utf-8",
-			errors="replace"
+			stdout=subprocess.PIPE,
+			stderr=subprocess.PIPE
 		)
 	except Exception as e:
+		try:
+			dump_path.write_text(f"Ошибка запуска steamcmd: {e}\nКоманда: {' '.join(cmd)}\n", encoding="utf-8", errors="replace")
+		except Exception:
+			pass
+		return None, None, dump_path
+
+	return p, None, dump_path
+
+
+def _finish_steamcmd(p: subprocess.Popen, app_id: int, branch: str = "public", timeout: int = 180) -> Tuple[Optional[str], Optional[Path]]:
+	"""
+	Дожидается запущенного steamcmd и разбирает его вывод.
+
+	Всегда пытается сохранить полный вывод steamcmd в dump-файл рядом со скриптом.
+	"""
+	dump_path = _SCRIPT_DIR / f"steamcmd_appinfo_{app_id}.txt"
+	cmd = [str(a) for a in p.args]
+
+	try:
+		stdout, stderr = p.communicate(timeout=timeout)
+	except subprocess.TimeoutExpired as e:
+		p.kill()
+		p.communicate()
 		try:
 			dump_path.write_text(f"Ошибка запуска steamcmd: {e}\nКоманда: {' '.join(cmd)}\n", encoding="utf-8", errors="replace")
 		except Exception:
 			pass
 		return None, dump_path
 
-	out = (p.stdout or "") + "\n" + (p.stderr or "")
+	# Вывод держим байтами: полный UTF-8 декод сотен КБ дампа не нужен,
+	# декодируем только маленький блок ветки и dump-файл
+	out = (stdout or b"") + b"\n" + (stderr or b"")
 
-	# Пишем dump ВСЕГДА, даже если steamcmd вернул ошибку
+	# Пишем dump ВСЕГДА, даже если steamcmd вернул ошибку.
+	# Байты выводим как есть через os.write — без повторного encode
+	# и буферов питоновского IO-стека
 	try:
-		dump_path.write_text(
-			f"ReturnCode: {p.returncode}\nCommand: {' '.join(cmd)}\n\n{out}",
-			encoding="utf-8",
-			errors="replace"
-		)
-	except Exception:
+		header = f"ReturnCode: {p.returncode}\nCommand: {' '.join(cmd)}\n\n".encode("utf-8")
+		fd = os.open(str(dump_path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
+		try:
+			os.write(fd, header)
+			os.write(fd, out)
+		finally:
+			os.close(fd)
+	except OSError:
 		# Если не смогли записать, хотя бы не падаем
 		pass
 
-	# Парсим нужную ветку
-	branch_block = _extract_branch_block(out, branch_name=branch)
-	if branch_block:
-		m = re.search(r'(?im)^\s*"buildid"\s*"(\d+)"\s*$', branch_block)
-		if m:
-			return m.group(1), dump_path
+	# Дешёвый предпросмотр: если имени ветки в выводе вообще нет,
+	# не запускаем ни вырезатель, ни VDF-разбор — сразу общий fallback.
+	# Оператор in ищет подстроку на уровне C, это сильно быстрее балансера
+	if f'"{branch}"'.encode("utf-8") in out:
+		# Блок ветки вырезаем по байтам, декодируем только его
+		branch_block = _extract_branch_block(out, branch_name=branch)
+		if branch_block:
+			m = _BUILDID_I_RE.search(branch_block.decode("utf-8", errors="replace"))
+			if m:
+				_save_steamcmd_cache(app_id, branch, m.group(1))
+				return m.group(1), dump_path
+
+		# Fallback: полный VDF-разбор, если байтовый вырезатель не справился
+		try:
+			buildid = _find_branch_buildid(
+				_parse_vdf(out.decode("utf-8", errors="replace")), branch
+			)
+		except Exception:
+			buildid = None
+		if buildid:
+			_save_steamcmd_cache(app_id, branch, buildid)
+			return buildid, dump_path
 
 	# Fallback: ищем buildid хоть где-то (чтобы понять, что данные вообще есть)
-	m_any = re.search(r'(?im)^\s*"buildid"\s*"(\d+)"\s*$', out)
+	m_any = _BUILDID_B_RE.search(out)
 	if m_any:
-		return m_any.group(1), dump_path
+		buildid = m_any.group(1).decode("ascii")
+		_save_steamcmd_cache(app_id, branch, buildid)
+		return buildid, dump_path
 
 	return None, dump_path
 
+
+def steamcmd_get_buildid(steamcmd_path: Path, app_id: int, branch: str = "public", timeout: int = 180, force: bool = False) -> Tuple[Optional[str], Optional[Path]]:
+	"""
+	Через steamcmd вытаскивает buildid указанной ветки для app_id.
+
+	Если steamcmd не запускается, возвращает (None, dump_path) и пишет причину в dump.
+	Свежий buildid (моложе _STEAMCMD_CACHE_TTL_SEC) берётся из кэша без
+	запуска steamcmd; force=True игнорирует кэш.
+	"""
+	p, cached, dump_path = _launch_steamcmd(steamcmd_path, app_id, branch=branch, force=force)
+	if p is None:
+		return cached, dump_path
+	return _finish_steamcmd(p, app_id, branch=branch, timeout=timeout)
+
+
+@functools.lru_cache(maxsize=1024)
 def fmt_ts(ts: Optional[int]) -> str:
-	"""Форматирует unix timestamp."""
+	"""Форматирует unix timestamp. Повторные значения берутся из lru_cache."""
 	if not ts:
 		return "—"
 	try:
@@ -411,6 +704,7 @@ def main() -> int:
 	parser.add_argument("--ini", default=r"Zomboid\Server\servertest.ini", help="Путь к servertest.ini")
 	parser.add_argument("--steamapps", default=r"serverfiles\steamapps", help="Путь к serverfiles\\steamapps")
 	parser.add_argument("--steamcmd", default=r".\.\bin\steamcmd\steamcmd.exe", help="Путь к steamcmd.exe")
+	parser.add_argument("--force-steamcmd", action="store_true", help="Игнорировать кэш buildid и запустить steamcmd заново")
 	args = parser.parse_args()
 
 	ini_path = Path(args.ini)
@@ -419,99 +713,118 @@ def main() -> int:
 	steamcmd_path = steamcmd_path.resolve()
 
 	log_path = script_dir / "pz_versions.log"
+	log = Logger(log_path)
 
-	_write_log_line(log_path, "")
-	_write_log_line(log_path, f"[{_now_str()}] Старт проверки")
-	_write_log_line(log_path, f"INI: {ini_path}")
-	_write_log_line(log_path, f"Steamapps: {steamapps_dir}")
-	_write_log_line(log_path, f"SteamCMD: {steamcmd_path}")
-	_write_log_line(log_path, "-" * 90)
+	log.info("")
+	log.info(f"[{_now_str()}] Старт проверки")
+	log.info(f"INI: {ini_path}")
+	log.info(f"Steamapps: {steamapps_dir}")
+	log.info(f"SteamCMD: {steamcmd_path}")
+	log.info("-" * 90)
 
 	try:
 		workshop_ids = parse_workshop_ids_from_ini(ini_path)
 	except Exception as e:
-		_write_log_line(log_path, f"ОШИБКА: не удалось прочитать/распарсить ini: {e}")
+		log.info(f"ОШИБКА: не удалось прочитать/распарсить ini: {e}")
 		return 1
 
 	if not workshop_ids:
-		_write_log_line(log_path, "WorkshopItems не найден или пуст.")
-		_write_log_line(log_path, f"[{_now_str()}] Готово. Лог: {log_path}")
+		log.info("WorkshopItems не найден или пуст.")
+		log.info(f"[{_now_str()}] Готово. Лог: {log_path}")
 		return 0
 
-	_write_log_line(log_path, f"Найдено Workshop ID: {len(workshop_ids)}")
-	_write_log_line(log_path, f"Порядок ID: {', '.join(workshop_ids)}")
+	log.info(f"Найдено Workshop ID: {len(workshop_ids)}")
+	log.info(f"Порядок ID: {', '.join(workshop_ids)}")
+
+	# steamcmd стартует уже сейчас: его многосекундный запуск прячется
+	# за HTTP-запросом к Steam и сканом локальных модов
+	branch_name = "unstable"
+	steamcmd_proc, steamcmd_cached, steamcmd_dump = _launch_steamcmd(
+		steamcmd_path, SERVER_APP_ID, branch=branch_name, force=args.force_steamcmd
+	)
 
-	_write_log_line(log_path, "-" * 90)
-	_write_log_line(log_path, "Получение удалённых данных по модам из Steam (PublishedFileDetails)...")
+	log.info("-" * 90)
+	log.info("Получение удалённых данных по модам из Steam (PublishedFileDetails)...")
 
+	# Steam-запрос и сканирование локальных папок модов независимы и ждут
+	# ввод-вывод, поэтому выполняются параллельно.
 	remote_map: Dict[str, ModRemoteInfo] = {}
-	try:
-		remote_map = steam_get_published_file_details(workshop_ids)
-		_write_log_line(log_path, f"Steam ответил по модам: {len(remote_map)}")
-	except Exception as e:
-		_write_log_line(log_path, f"ОШИБКА: не удалось получить PublishedFileDetails: {e}")
+	with ThreadPoolExecutor(max_workers=16) as ex:
+		remote_future = ex.submit(steam_get_published_file_details, workshop_ids)
+		local_map: Dict[str, List[ModLocalInfo]] = dict(ex.map(
+			lambda w: (w, find_local_mod_infos(steamapps_dir, w)),
+			workshop_ids,
+		))
+		try:
+			remote_map = remote_future.result()
+			log.info(f"Steam ответил по модам: {len(remote_map)}")
+		except Exception as e:
+			log.info(f"ОШИБКА: не удалось получить PublishedFileDetails: {e}")
 
-	_write_log_line(log_path, "-" * 90)
-	_write_log_line(log_path, "Сравнение локальных модов с Steam:")
+	log.info("-" * 90)
+	log.info("Сравнение локальных модов с Steam:")
 
 	for wid in workshop_ids:
-		_write_log_line(log_path, "")
-		_write_log_line(log_path, f"[MOD {wid}]")
+		# Блок по моду собираем списком и пишем одним write
+		lines = ["", f"[MOD {wid}]"]
 
 		remote = remote_map.get(wid)
 		if remote:
-			_write_log_line(log_path, f"Steam result: {remote.result}")
-			_write_log_line(log_path, f"Steam title: {remote.title or '—'}")
-			_write_log_line(log_path, f"Steam time_updated: {fmt_ts(remote.time_updated)}")
-			_write_log_line(log_path, f"Steam consumer_app_id: {remote.consumer_app_id or '—'}")
+			lines.append(f"Steam result: {remote.result}")
+			lines.append(f"Steam title: {remote.title or '—'}")
+			lines.append(f"Steam time_updated: {fmt_ts(remote.time_updated)}")
+			lines.append(f"Steam consumer_app_id: {remote.consumer_app_id or '—'}")
 		else:
-			_write_log_line(log_path, "Steam данные: — (нет ответа/ошибка)")
+			lines.append("Steam данные: — (нет ответа/ошибка)")
 
-		local_infos = find_local_mod_infos(steamapps_dir, wid)
+		local_infos = local_map[wid]
 		for li in local_infos:
-			_write_log_line(log_path, f"Локальный мод каталог: {li.mod_dir}")
-			_write_log_line(log_path, f"mod.info: {li.mod_info_path or '—'}")
-			_write_log_line(log_path, f"Локальная версия (из mod.info): {li.local_version or '—'}")
-			_write_log_line(log_path, f"Локальная дата (mtime): {fmt_ts(li.local_mtime)}")
+			lines.append(f"Локальный мод каталог: {li.mod_dir}")
+			lines.append(f"mod.info: {li.mod_info_path or '—'}")
+			lines.append(f"Локальная версия (из mod.info): {li.local_version or '—'}")
+			lines.append(f"Локальная дата (mtime): {fmt_ts(li.local_mtime)}")
 
 			if remote and remote.time_updated and li.local_mtime:
 				if li.local_mtime >= remote.time_updated:
-					_write_log_line(log_path, "Сравнение: OK (локально не старее Steam по времени)")
+					lines.append("Сравнение: OK (локально не старее Steam по времени)")
 				else:
-					_write_log_line(log_path, "Сравнение: НУЖНО ОБНОВИТЬ (локально старее Steam по времени)")
+					lines.append("Сравнение: НУЖНО ОБНОВИТЬ (локально старее Steam по времени)")
 			else:
-				_write_log_line(log_path, "Сравнение: пропущено (нет времени Steam или локального mtime)")
+				lines.append("Сравнение: пропущено (нет времени Steam или локального mtime)")
 
-	_write_log_line(log_path, "-" * 90)
-	_write_log_line(log_path, "Проверка версии Dedicated Server:")
+		log.info_many(lines)
+
+	log.info("-" * 90)
+	log.info("Проверка версии Dedicated Server:")
 
 	appmanifest_path = steamapps_dir / f"appmanifest_{SERVER_APP_ID}.acf"
 	local_buildid, local_lastupdated = parse_appmanifest_build_info(appmanifest_path)
 
-	_write_log_line(log_path, f"Локальный appmanifest: {appmanifest_path}")
-	_write_log_line(log_path, f"Локальный buildid: {local_buildid or '—'}")
-	_write_log_line(log_path, f"Локальный LastUpdated: {fmt_ts(local_lastupdated)}")
-
-	_write_log_line(log_path, "")
-	_write_log_line(log_path, "Получение актуального buildid через steamcmd...")
+	log.info(f"Локальный appmanifest: {appmanifest_path}")
+	log.info(f"Локальный buildid: {local_buildid or '—'}")
+	log.info(f"Локальный LastUpdated: {fmt_ts(local_lastupdated)}")
 
-	branch_name = "unstable"
+	log.info("")
+	log.info("Получение актуального buildid через steamcmd...")
 
-	remote_buildid, dump_path = steamcmd_get_buildid(steamcmd_path, SERVER_APP_ID, branch=branch_name)
+	if steamcmd_proc is not None:
+		remote_buildid, dump_path = _finish_steamcmd(steamcmd_proc, SERVER_APP_ID, branch=branch_name)
+	else:
+		remote_buildid, dump_path = steamcmd_cached, steamcmd_dump
 
-	_write_log_line(log_path, f"Steam buildid ({branch_name}): {remote_buildid or '—'}")
-	_write_log_line(log_path, f"Steamcmd dump: {dump_path or '—'}")
+	log.info(f"Steam buildid ({branch_name}): {remote_buildid or '—'}")
+	log.info(f"Steamcmd dump: {dump_path or '—'}")
 
 	if local_buildid and remote_buildid:
 		if local_buildid == remote_buildid:
-			_write_log_line(log_path, "Сервер: OK (buildid совпадает)")
+			log.info("Сервер: OK (buildid совпадает)")
 		else:
-			_write_log_line(log_path, "Сервер: НУЖНО ОБНОВИТЬ (buildid отличается)")
+			log.info("Сервер: НУЖНО ОБНОВИТЬ (buildid отличается)")
 	else:
-		_write_log_line(log_path, "Сервер: сравнение пропущено (не удалось получить buildid локально или через steamcmd)")
+		log.info("Сервер: сравнение пропущено (не удалось получить buildid локально или через steamcmd)")
 
-	_write_log_line(log_path, "-" * 90)
-	_write_log_line(log_path, f"[{_now_str()}] Готово. Лог: {log_path}")
+	log.info("-" * 90)
+	log.info(f"[{_now_str()}] Готово. Лог: {log_path}")
 	return 0
 
 
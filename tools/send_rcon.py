@@ -24,58 +24,76 @@ def parse_config(path: Path) -> dict:
     return data
 
 
-def recv_exact(sock: socket.socket, length: int) -> bytes:
-    chunks = []
-    remaining = length
-    while remaining > 0:
-        chunk = sock.recv(remaining)
-        if not chunk:
-            raise ConnectionError("Connection closed by server")
-        chunks.append(chunk)
-        remaining -= len(chunk)
-    return b"".join(chunks)
-
-
-def recv_packet(sock: socket.socket):
-    raw_len = recv_exact(sock, 4)
-    (length,) = struct.unpack("<i", raw_len)
-    payload = recv_exact(sock, length)
-    req_id, packet_type = struct.unpack("<ii", payload[:8])
-    body = payload[8:-2]
-    return req_id, packet_type, body
-
-
-def send_packet(sock: socket.socket, req_id: int, packet_type: int, body: str) -> None:
-    body_bytes = body.encode("utf-8")
-    packet = struct.pack("<iii", len(body_bytes) + 10, req_id, packet_type) + body_bytes + b"\x00\x00"
-    sock.sendall(packet)
-
-
-def authenticate(sock: socket.socket, password: str) -> bool:
-    send_packet(sock, 1, 3, password)  # 3 == SERVERDATA_AUTH
-    while True:
-        req_id, packet_type, _ = recv_packet(sock)
-        if packet_type == 2:  # SERVERDATA_AUTH_RESPONSE
-            return req_id != -1
-        if req_id == -1:
-            return False
+class RconSession:
+    """
+    RCON connection with one persistent receive buffer: recv(4096) feeds a
+    bytearray and complete packets are sliced out of it, instead of a recv
+    call per fragment plus a list/join per packet.
+    """
+
+    def __init__(self, sock: socket.socket) -> None:
+        self._sock = sock
+        self._buf = bytearray()
+
+    def recv_packet(self):
+        while True:
+            if len(self._buf) >= 4:
+                (length,) = struct.unpack_from("<i", self._buf)
+                total = 4 + length
+                if len(self._buf) >= total:
+                    req_id, packet_type = struct.unpack_from("<ii", self._buf, 4)
+                    body = bytes(memoryview(self._buf)[12:total - 2])
+                    del self._buf[:total]
+                    return req_id, packet_type, body
+            chunk = self._sock.recv(4096)
+            if not chunk:
+                raise ConnectionError("Connection closed by server")
+            self._buf += chunk
+
+    def send_packet(self, req_id: int, packet_type: int, body: str) -> None:
+        body_bytes = body.encode("utf-8")
+        packet = struct.pack("<iii", len(body_bytes) + 10, req_id, packet_type) + body_bytes + b"\x00\x00"
+        self._sock.sendall(packet)
+
+    def authenticate(self, password: str) -> bool:
+        self.send_packet(1, 3, password)  # 3 == SERVERDATA_AUTH
+        while True:
+            req_id, packet_type, _ = self.recv_packet()
+            if packet_type == 2:  # SERVERDATA_AUTH_RESPONSE
+                return req_id != -1
+            if req_id == -1:
+                return False
 
 
 def send_command(host: str, port: int, password: str, command: str, timeout: float = 5.0) -> str:
     with socket.create_connection((host, port), timeout=timeout) as sock:
         sock.settimeout(timeout)
+        session = RconSession(sock)
 
-        if not authenticate(sock, password):
+        if not session.authenticate(password):
             raise ConnectionError("RCON auth failed")
 
-        send_packet(sock, 2, 2, command)  # 2 == SERVERDATA_EXECCOMMAND
-        try:
-            req_id, packet_type, body = recv_packet(sock)
+        session.send_packet(2, 2, command)  # 2 == SERVERDATA_EXECCOMMAND
+        # Empty-mirror trick: the server answers this dummy packet after the
+        # real response, so its echo marks end-of-response and multi-packet
+        # replies don't have to wait out the socket timeout.
+        session.send_packet(3, 0, "")  # 0 == SERVERDATA_RESPONSE_VALUE
+
+        parts = []
+        while True:
+            try:
+                req_id, packet_type, body = session.recv_packet()
+            except (socket.timeout, ConnectionError):
+                # Timeout or server-side close just ends the response;
+                # whatever already arrived is the answer.
+                break
             if packet_type not in (0, 2):
                 raise ConnectionError(f"Unexpected packet type {packet_type}")
-            return body.decode("utf-8", errors="replace")
-        except socket.timeout:
-            return ""
+            if req_id == 3:
+                break
+            if req_id == 2:
+                parts.append(body)
+        return b"".join(parts).decode("utf-8", errors="replace")
 
 
 def main():